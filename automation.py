@@ -0,0 +1,205 @@
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2 import service_account
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from twilio.base.exceptions import TwilioRestException
+from twilio.rest import Client
+
+logger = logging.getLogger(__name__)
+
+SCOPES = ["https://www.googleapis.com/auth/calendar"]
+SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "credentials.json")
+
+TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
+TWILIO_FROM_NUMBER = os.getenv("TWILIO_FROM_NUMBER", "")
+SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN", "")
+
+_clients_lock = threading.Lock()
+_calendar_service = None
+_twilio_client = None
+_slack_client = None
+
+
+def get_calendar_service():
+    """Build the Calendar client once and reuse its HTTP connection pool."""
+    global _calendar_service
+    if _calendar_service is None:
+        with _clients_lock:
+            if _calendar_service is None:
+                credentials = service_account.Credentials.from_service_account_file(
+                    SERVICE_ACCOUNT_FILE, scopes=SCOPES
+                )
+                authed_http = google_auth_httplib2.AuthorizedHttp(
+                    credentials, http=httplib2.Http(timeout=30)
+                )
+                _calendar_service = build("calendar", "v3", http=authed_http)
+    return _calendar_service
+
+
+def get_twilio_client():
+    global _twilio_client
+    if _twilio_client is None:
+        with _clients_lock:
+            if _twilio_client is None:
+                _twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+    return _twilio_client
+
+
+def get_slack_client():
+    global _slack_client
+    if _slack_client is None:
+        with _clients_lock:
+            if _slack_client is None:
+                _slack_client = WebClient(token=SLACK_BOT_TOKEN)
+    return _slack_client
+
+# HTTP statuses worth retrying: rate limits and transient server errors.
+_RETRIABLE_STATUS = {403, 429, 500, 502, 503}
+
+# Client errors that will never succeed on retry.
+_PERMANENT_STATUS = {400, 401, 403, 404}
+
+# Retry only transient API failures, fail fast on everything else.
+_retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=8),
+    retry=retry_if_exception_type((TwilioRestException, HttpError, SlackApiError)),
+    reraise=True,
+)
+
+
+class PermanentAPIError(Exception):
+    """A 4xx-style failure that retrying cannot fix."""
+
+
+def _build_event(candidate_name, candidate_email, hr_email, interview_time):
+    return {
+        "summary": f"Interview with {candidate_name}",
+        "description": f"Interview for {candidate_name} scheduled by HR Agent.",
+        "start": {"dateTime": interview_time.isoformat(), "timeZone": "UTC"},
+        "end": {
+            "dateTime": (interview_time + timedelta(minutes=30)).isoformat(),
+            "timeZone": "UTC",
+        },
+        "attendees": [{"email": candidate_email}, {"email": hr_email}],
+    }
+
+
+def schedule_interview(candidate_name, candidate_email, hr_email, interview_time):
+    """Create a single calendar event for one candidate interview.
+
+    Transient failures are retried inside ``execute`` with exponential
+    backoff at the HTTP layer, so the event dict is built only once.
+    """
+    event = _build_event(candidate_name, candidate_email, hr_email, interview_time)
+    created = (
+        get_calendar_service().events()
+        .insert(calendarId="primary", body=event)
+        .execute(num_retries=5)
+    )
+    logger.info(
+        "Scheduled interview for %s: %s", candidate_name, created.get("htmlLink")
+    )
+    return created
+
+
+def schedule_interviews_batch(items, max_attempts=4):
+    """Create calendar events for many interviews in one HTTP round-trip.
+
+    ``items`` is a list of ``(candidate_name, candidate_email, hr_email,
+    interview_time)`` tuples. All inserts are submitted through a single
+    multipart ``BatchHttpRequest``; entries that fail with a transient HTTP
+    status are re-queued into a follow-up batch with exponential backoff.
+    Returns the list of created events, in input order where possible.
+    """
+    pending = list(enumerate(items))
+    created = {}
+    calendar_service = get_calendar_service()
+
+    for attempt in range(max_attempts):
+        if not pending:
+            break
+        retry_queue = []
+
+        def _on_event(request_id, response, exception):
+            index = int(request_id)
+            if exception is None:
+                created[index] = response
+                logger.info(
+                    "Scheduled interview for %s: %s",
+                    items[index][0],
+                    response.get("htmlLink"),
+                )
+            elif (
+                isinstance(exception, HttpError)
+                and exception.resp.status in _RETRIABLE_STATUS
+            ):
+                retry_queue.append((index, items[index]))
+            else:
+                logger.error(
+                    "Failed to schedule interview for %s: %s",
+                    items[index][0],
+                    exception,
+                )
+
+        batch = calendar_service.new_batch_http_request(callback=_on_event)
+        for index, (name, email, hr_email, when) in pending:
+            event = _build_event(name, email, hr_email, when)
+            batch.add(
+                calendar_service.events().insert(calendarId="primary", body=event),
+                request_id=str(index),
+            )
+        batch.execute()
+
+        pending = retry_queue
+        if pending and attempt < max_attempts - 1:
+            time.sleep(2**attempt)
+
+    for index, (name, _, _, _) in pending:
+        logger.error(
+            "Giving up on scheduling interview for %s after %d batches",
+            name,
+            max_attempts,
+        )
+    return [created[i] for i in sorted(created)]
+
+
+@_retry_transient
+def send_sms(to_number, message):
+    """Send an SMS notification through Twilio."""
+    try:
+        result = get_twilio_client().messages.create(
+            body=message, from_=TWILIO_FROM_NUMBER, to=to_number
+        )
+    except TwilioRestException as err:
+        if err.status in _PERMANENT_STATUS:
+            # Short-circuit tenacity: a bad number or bad credentials
+            # will fail identically on every attempt.
+            raise PermanentAPIError(str(err)) from err
+        raise
+    logger.info("Sent SMS to %s: %s", to_number, result.sid)
+    return result
+
+
+@_retry_transient
+def send_slack_message(channel, message):
+    """Post a notification message to a Slack channel."""
+    result = get_slack_client().chat_postMessage(channel=channel, text=message)
+    logger.info("Sent Slack message to %s", channel)
+    return result
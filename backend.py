@@ -0,0 +1,34 @@
+import io
+import json
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+
+from src.interview import analyze_response, transcribe_audio
+from src.ranking import rank_candidates
+from src.utils import setup_logging
+
+setup_logging()
+app = FastAPI(title="HR Agent backend")
+
+
+@app.post("/rank_candidates")
+async def rank_candidates_endpoint(payload: dict):
+    ranked = rank_candidates(payload.get("resumes", []), payload.get("job", {}))
+    return {"ranked_candidates": ranked}
+
+
+@app.websocket("/ws/interview")
+async def interview_endpoint(websocket: WebSocket):
+    await websocket.accept()
+    try:
+        while True:
+            audio_bytes = await websocket.receive_bytes()
+            transcript = transcribe_audio(io.BytesIO(audio_bytes))
+            score, sentiment = await analyze_response(transcript)
+            await websocket.send_text(
+                json.dumps(
+                    {"transcript": transcript, "score": score, "sentiment": sentiment}
+                )
+            )
+    except WebSocketDisconnect:
+        pass
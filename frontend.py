@@ -0,0 +1,503 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import orjson
+import pandas as pd
+import PyPDF2
+import requests
+import streamlit as st
+import websockets
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from automation import schedule_interviews_batch
+from src.utils import setup_logging
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+WEBSOCKET_URL = os.getenv("WEBSOCKET_URL", "ws://localhost:8000/ws/interview")
+SMTP_USER = os.getenv("SMTP_USER", "")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+HR_EMAIL = os.getenv("HR_EMAIL", SMTP_USER)
+JOBS_CSV = os.getenv("JOBS_CSV", "data/job_title_des.csv")
+
+_YEARS_RE = re.compile(r"(\d+\.?\d*)\+?\s*years?", re.IGNORECASE)
+_SPLIT_RE = re.compile(r"[,\s;]+")
+_SKILL_KWS = frozenset(["skill", "proficien", "experience with", "knowledge of"])
+_EDU_KWS = frozenset(["degree", "bachelor", "master", "phd", "education"])
+_CERT_KWS = frozenset(["certification", "certificate", "certified"])
+_STOP = frozenset(["in", "and", "of"])
+
+# Keep-alive session to the ranking backend: one TCP handshake for the
+# process instead of one per Streamlit rerun, with transient-status
+# retries handled at the adapter layer. POST must be opted in (urllib3
+# excludes it by default); the ranking call is idempotent, so retrying
+# it is safe.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={"POST"},
+        ),
+    ),
+)
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={
+        "streamlit.runtime.uploaded_file_manager.UploadedFile": lambda f: hashlib.md5(
+            f.getvalue()
+        ).digest()
+    },
+)
+def parse_resume(resume_file):
+    """Extract contact details, skills, experience, education and
+    certifications from an uploaded PDF resume.
+
+    Cached by file content, so re-uploading an identical PDF across
+    Streamlit reruns skips the PDF extraction entirely.
+    """
+    reader = PyPDF2.PdfReader(resume_file)
+    text = ""
+    for page in reader.pages:
+        text += (page.extract_text() or "") + "\n"
+
+    email_match = re.search(r"[\w.+-]+@[\w-]+\.[\w.-]+", text)
+    phone_match = re.search(r"\+?\d[\d\s().-]{8,}\d", text)
+
+    sections = {"skills": [], "experience": [], "education": [], "certifications": []}
+    current = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        heading = stripped.lower().rstrip(":")
+        if heading in ("skills", "technical skills"):
+            current = "skills"
+            continue
+        if heading in ("experience", "work experience", "employment history"):
+            current = "experience"
+            continue
+        if heading == "education":
+            current = "education"
+            continue
+        if heading in ("certifications", "certificates"):
+            current = "certifications"
+            continue
+        if current == "skills":
+            sections["skills"].extend(
+                s.strip() for s in re.split(r"[,;•|]+", stripped) if s.strip()
+            )
+        elif current:
+            sections[current].append(stripped)
+
+    return {
+        "name": text.splitlines()[0].strip() if text.strip() else resume_file.name,
+        "email": email_match.group(0) if email_match else "",
+        "phone": phone_match.group(0) if phone_match else "",
+        "skills": sections["skills"],
+        "experience": sections["experience"],
+        "education": sections["education"],
+        "certifications": sections["certifications"],
+    }
+
+
+def parse_resumes(resume_files):
+    """Parse every uploaded resume into a structured dict.
+
+    PDF extraction is I/O-bound and releases the GIL, so the files are
+    parsed concurrently; results come back in upload order. Parsed
+    results are also memoized per session by a blake2b hash of the file
+    bytes, so duplicate uploads (or the same pool re-ranked against a
+    different job) are never parsed twice.
+    """
+    cache = st.session_state.setdefault("resume_cache", {})
+    keys = [
+        hashlib.blake2b(f.getvalue(), digest_size=16).digest() for f in resume_files
+    ]
+    new_files = {k: f for k, f in zip(keys, resume_files) if k not in cache}
+    if new_files:
+        with ThreadPoolExecutor(max_workers=min(16, len(new_files))) as executor:
+            parsed = executor.map(parse_resume, new_files.values())
+        cache.update(zip(new_files.keys(), parsed))
+    resume_data_list = [cache[k] for k in keys]
+    if logger.isEnabledFor(logging.INFO):
+        for resume_file, resume_data in zip(resume_files, resume_data_list):
+            logger.info(
+                "Processed resume %s: %s", resume_file.name, json.dumps(resume_data)
+            )
+    return resume_data_list
+
+
+@st.cache_data(show_spinner=False)
+def parse_job_description(job_description):
+    """Pull required skills, minimum experience, education and
+    certifications out of a free-text job description.
+
+    Pure in its input string, so Streamlit reruns over the same job
+    description hit the content-hash cache instead of re-parsing.
+    """
+    job_data = {
+        "required_skills": [],
+        "min_experience": 0,
+        "education": [],
+        "certifications": [],
+    }
+    for line in job_description.splitlines():
+        lower = line.lower()
+        match = _YEARS_RE.search(line)
+        if match:
+            job_data["min_experience"] = max(job_data["min_experience"], float(match.group(1)))
+        if any(kw in lower for kw in _SKILL_KWS):
+            skills_part = line.split(":", 1)[-1]
+            job_data["required_skills"].extend(
+                s for s in _SPLIT_RE.split(skills_part)
+                if s and s.lower() not in _STOP
+            )
+        if any(kw in lower for kw in _EDU_KWS):
+            job_data["education"].append(line.strip())
+        if any(kw in lower for kw in _CERT_KWS):
+            job_data["certifications"].append(line.strip())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Parsed job description: %s", json.dumps(job_data))
+    return job_data
+
+
+@st.cache_data(show_spinner=False)
+def _load_jobs(path):
+    """Load the jobs CSV into a title -> description dict.
+
+    Columnar zip over the two columns avoids materializing a Series per
+    row, and the cache keeps Streamlit reruns from re-reading the CSV.
+    """
+    df = pd.read_csv(path)
+    return dict(zip(df["job title"].to_numpy(), df["job description"].to_numpy()))
+
+
+def rank_candidates(resume_data_list, job_data):
+    """Send the parsed resumes and job data to the ranking backend.
+
+    Serialization uses orjson on both directions: several times faster
+    than stdlib json, which matters for large candidate pools.
+    """
+    payload = {"resumes": resume_data_list, "job": job_data}
+    response = _SESSION.post(
+        f"{BACKEND_URL}/rank_candidates",
+        data=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+        timeout=60,
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Ranked %d candidates: %s", len(data["ranked_candidates"]), json.dumps(data)
+        )
+    return data["ranked_candidates"]
+
+
+def schedule_interviews(ranked_candidates, start_time=None, slot_minutes=45):
+    """Assign consecutive interview slots to candidates in rank order."""
+    if start_time is None:
+        start_time = datetime.now().replace(second=0, microsecond=0) + timedelta(days=1)
+    schedules = []
+    for i, candidate in enumerate(ranked_candidates):
+        resume = candidate["resume"]
+        schedules.append(
+            {
+                "name": resume.get("name", "Unknown"),
+                "email": resume.get("email", ""),
+                "time": start_time + timedelta(minutes=slot_minutes * i),
+            }
+        )
+    return schedules
+
+
+class SmtpPool:
+    """A lazily-connected SMTP session shared across emails.
+
+    Connecting, STARTTLS and AUTH cost a few hundred milliseconds per
+    message when done in ``send_interview_email`` itself; keeping one
+    logged-in session and reconnecting only on disconnect makes bulk
+    sends pay that handshake once.
+    """
+
+    def __init__(self, host="smtp.gmail.com", port=587):
+        self._host = host
+        self._port = port
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _connect(self):
+        server = smtplib.SMTP(self._host, self._port)
+        server.starttls()
+        server.login(SMTP_USER, SMTP_PASSWORD)
+        return server
+
+    def send(self, msg):
+        with self._lock:
+            if self._server is None:
+                self._server = self._connect()
+            try:
+                self._server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                self._server = self._connect()
+                self._server.send_message(msg)
+
+
+_smtp_pool = SmtpPool()
+
+
+def send_interview_email(schedule):
+    """Email one candidate their interview slot."""
+    msg = MIMEMultipart()
+    msg["From"] = SMTP_USER
+    msg["To"] = schedule["email"]
+    msg["Subject"] = "Interview Invitation"
+    body = (
+        f"Dear {schedule['name']},\n\n"
+        f"You have been shortlisted for an interview on "
+        f"{schedule['time'].strftime('%Y-%m-%d at %H:%M')} (UTC).\n\n"
+        f"Best regards,\nHR Team"
+    )
+    msg.attach(MIMEText(body, "plain"))
+    _smtp_pool.send(msg)
+    logger.info("Sent interview email to %s", schedule["email"])
+
+
+_ws_loop = None
+_ws_loop_lock = threading.Lock()
+_ws_pool_task = None
+_WS_POOL_SIZE = 4
+
+
+def _get_ws_loop():
+    """Start (once) and return the shared background asyncio loop.
+
+    Spinning up a fresh executor, loop and websocket per call cost more
+    than the actual I/O; one daemon loop thread serves all calls.
+    """
+    global _ws_loop
+    if _ws_loop is None:
+        with _ws_loop_lock:
+            if _ws_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="ws-loop", daemon=True
+                )
+                thread.start()
+                _ws_loop = loop
+    return _ws_loop
+
+
+async def _build_ws_pool():
+    """Open the pool's connections; on failure close the partial set."""
+    connections = []
+    try:
+        for _ in range(_WS_POOL_SIZE):
+            connections.append(
+                await websockets.connect(WEBSOCKET_URL, ping_interval=20)
+            )
+    except Exception:
+        for ws in connections:
+            await ws.close()
+        raise
+    pool = asyncio.Queue()
+    for ws in connections:
+        pool.put_nowait(ws)
+    return pool
+
+
+async def _get_ws_pool():
+    """Return the shared pool of open websocket connections.
+
+    Built lazily on the background loop; warm_ws_pool() kicks this off
+    at app startup so the TLS/WS handshakes are paid before the first
+    answer is submitted. The build is memoized as a task on the loop,
+    so overlapping callers (page reruns, in-flight answers) await the
+    one build in progress instead of each racing four connects and
+    leaking the losers. A failed build stays failed for its awaiters
+    (a down backend fails fast) and the next caller starts a fresh one.
+    """
+    global _ws_pool_task
+    if _ws_pool_task is None or (
+        _ws_pool_task.done() and _ws_pool_task.exception() is not None
+    ):
+        _ws_pool_task = asyncio.ensure_future(_build_ws_pool())
+    return await _ws_pool_task
+
+
+def warm_ws_pool():
+    """Pre-open the websocket pool without blocking the caller."""
+    future = asyncio.run_coroutine_threadsafe(_get_ws_pool(), _get_ws_loop())
+
+    def _log_failure(fut):
+        exc = fut.exception()
+        if exc is not None:
+            logger.warning("Websocket pool warm-up failed: %s", exc)
+
+    future.add_done_callback(_log_failure)
+
+
+async def interview_websocket(audio_file):
+    """Stream one recorded answer to the interview backend and return its analysis.
+
+    Connections are drawn from the warm pool and returned afterwards;
+    when the pool is momentarily empty a one-off connection is opened
+    instead of waiting, and a connection the server has closed is
+    replaced and the send retried once. A backend that is down
+    surfaces as a connect error here, as in the connect-per-call days.
+    """
+    pool = await _get_ws_pool()
+    try:
+        ws = pool.get_nowait()
+    except asyncio.QueueEmpty:
+        ws = await websockets.connect(WEBSOCKET_URL, ping_interval=20)
+    try:
+        for attempt in (0, 1):
+            try:
+                audio_file.seek(0)
+                # Send in 64KB fragments: overlaps the read with the network
+                # send and avoids holding a second full copy of the audio.
+                await ws.send(iter(lambda: audio_file.read(65536), b""))
+                response = await ws.recv()
+                return json.loads(response)
+            except websockets.ConnectionClosed:
+                if attempt:
+                    raise
+                ws = await websockets.connect(WEBSOCKET_URL, ping_interval=20)
+    finally:
+        if pool.qsize() < _WS_POOL_SIZE:
+            pool.put_nowait(ws)
+        else:
+            await ws.close()
+
+
+def run_websocket(audio_file):
+    """Run the interview websocket coroutine from Streamlit's sync context."""
+    future = asyncio.run_coroutine_threadsafe(
+        interview_websocket(audio_file), _get_ws_loop()
+    )
+    return future.result(timeout=30)
+
+
+def main():
+    st.set_page_config(page_title="HR Agent", layout="wide")
+    page = st.sidebar.radio("Page", ["Candidate Ranking", "Audio Interview"])
+
+    if page == "Candidate Ranking":
+        st.title("Candidate Ranking")
+
+        job_descriptions = _load_jobs(JOBS_CSV)
+        job_title = st.selectbox("Job title", sorted(job_descriptions))
+        job_data = parse_job_description(job_descriptions[job_title])
+
+        resume_files = st.file_uploader(
+            "Upload resumes (PDF)", type="pdf", accept_multiple_files=True
+        )
+        if resume_files and st.button("Rank candidates"):
+            resume_data_list = parse_resumes(resume_files)
+            st.session_state.ranked_candidates = rank_candidates(resume_data_list, job_data)
+
+        if st.session_state.get("ranked_candidates"):
+            table_data = []
+            for candidate in st.session_state.ranked_candidates:
+                r = candidate["resume"]
+                table_data.append(
+                    {
+                        "Rank": candidate["rank"],
+                        "Name": r.get("name", "Not Found"),
+                        "Email": r.get("email", "Not Found"),
+                        "Skills": ", ".join(r["skills"]),
+                        "Score": candidate["total_score"],
+                    }
+                )
+            st.dataframe(pd.DataFrame(table_data))
+
+            if st.button("Schedule interviews"):
+                schedules = schedule_interviews(st.session_state.ranked_candidates)
+                schedule_interviews_batch(
+                    [
+                        (s["name"], s["email"], HR_EMAIL, s["time"])
+                        for s in schedules
+                        if s["email"]
+                    ]
+                )
+                to_email = [s for s in schedules if s["email"]]
+                if to_email:
+                    with ThreadPoolExecutor(max_workers=min(8, len(to_email))) as executor:
+                        list(executor.map(send_interview_email, to_email))
+                for rank, schedule in enumerate(schedules, start=1):
+                    if not schedule["email"]:
+                        st.warning(
+                            f"Candidate ranked {rank} has no "
+                            f"email address; skipping invitation."
+                        )
+                st.success("Interviews scheduled.")
+
+    elif page == "Audio Interview":
+        st.title("Audio Interview")
+        warm_ws_pool()
+
+        audio_file = st.file_uploader("Upload your recorded answer", type=["wav", "mp3"])
+        if audio_file and st.button("Analyze answer"):
+            results = {}
+            done = threading.Event()
+            updates = queue.Queue()
+
+            def run_interview():
+                try:
+                    updates.put("Analyzing answer...")
+                    results["analysis"] = run_websocket(audio_file)
+                except Exception as exc:
+                    results["error"] = str(exc)
+                finally:
+                    done.set()
+
+            worker = threading.Thread(target=run_interview, daemon=True)
+            worker.start()
+
+            total_timeout = 60
+            progress = st.empty()
+            deadline = time.monotonic() + total_timeout
+            # Event-driven wait: wake on completion (or every 100ms to
+            # drain progress messages), instead of a fixed 1s poll.
+            while not done.wait(timeout=0.1):
+                try:
+                    progress.text(updates.get_nowait())
+                except queue.Empty:
+                    pass
+                if time.monotonic() > deadline:
+                    break
+
+            if "analysis" in results:
+                st.json(results["analysis"])
+            elif "error" in results:
+                st.error(results["error"])
+            else:
+                st.error("Interview analysis timed out.")
+
+
+if __name__ == "__main__":
+    main()
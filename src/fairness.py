@@ -0,0 +1,92 @@
+import hashlib
+import logging
+import os
+
+import joblib
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DATA_PATH = os.getenv("FAIRNESS_DATA", "data/candidates.csv")
+CACHE_DIR = "data/cache"
+
+
+def _df_hash(df):
+    """Stable content hash of a DataFrame, used as the model cache key."""
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=True).values).hexdigest()[:16]
+
+
+def build_model(df):
+    """Train the scoring model and build its fairness artifacts.
+
+    Returns ``(model, explainer, metric)``. The fitted XGBoost model and
+    SHAP explainer are pickled to ``data/cache`` keyed by a hash of the
+    training data, so repeated calls over the same dataset load from
+    disk instead of refitting. The AIF360 metric is cheap to construct
+    and is rebuilt on every call.
+    """
+    # xgboost/shap/aif360 each drag in large native stacks; importing
+    # them here keeps `import src.fairness` down to a pandas import.
+    import shap
+    import xgboost as xgb
+    from aif360.datasets import BinaryLabelDataset
+    from aif360.metrics import BinaryLabelDatasetMetric
+
+    cache_path = os.path.join(CACHE_DIR, f"fairness_{_df_hash(df)}.pkl")
+    if os.path.exists(cache_path):
+        model, explainer = joblib.load(cache_path)
+        logger.info("Loaded cached fairness model from %s", cache_path)
+    else:
+        X = df.drop(columns=["hired"])
+        y = df["hired"]
+        model = xgb.XGBRegressor(n_estimators=100, max_depth=4, n_jobs=-1)
+        model.fit(X, y)
+        explainer = shap.Explainer(model, X)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        joblib.dump((model, explainer), cache_path)
+        logger.info("Cached fairness model to %s", cache_path)
+
+    dataset = BinaryLabelDataset(
+        df=df,
+        label_names=["hired"],
+        protected_attribute_names=["gender"],
+        favorable_label=1,
+        unfavorable_label=0,
+    )
+    metric = BinaryLabelDatasetMetric(
+        dataset,
+        privileged_groups=[{"gender": 1}],
+        unprivileged_groups=[{"gender": 0}],
+    )
+    return model, explainer, metric
+
+
+def fairness_report(df):
+    """Summarize bias metrics for the hiring dataset."""
+    _, _, metric = build_model(df)
+    report = {
+        "disparate_impact": metric.disparate_impact(),
+        "statistical_parity_difference": metric.statistical_parity_difference(),
+    }
+    logger.info("Fairness report: %s", report)
+    return report
+
+
+if __name__ == "__main__":
+    import matplotlib
+
+    from src.utils import setup_logging
+
+    setup_logging()
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import shap
+
+    df = pd.read_csv(DATA_PATH)
+    model, explainer, metric = build_model(df)
+    print(fairness_report(df))
+
+    shap_values = explainer(df.drop(columns=["hired"]))
+    shap.summary_plot(shap_values, df.drop(columns=["hired"]), show=False)
+    plt.savefig("shap_summary.png", bbox_inches="tight")
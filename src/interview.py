@@ -0,0 +1,391 @@
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pyaudio
+import pyttsx3
+import winsound
+import winspeech
+from openai import AsyncOpenAI
+from textblob import TextBlob
+
+from src.model_registry import get_whisper
+
+logger = logging.getLogger(__name__)
+
+FORMAT = pyaudio.paInt16
+CHANNELS = 1
+# Whisper's native sample rate: recording at 16kHz removes the
+# 44.1kHz -> 16kHz resample from every transcription.
+RATE = 16000
+CHUNK = 1024
+RECORD_SECONDS = 15
+TTS_CACHE_DIR = "data/tts_cache"
+
+# Trailing-silence early stop: finish once the candidate has spoken for
+# at least _MIN_ANSWER_SECONDS and then been quiet for
+# _TRAILING_SILENCE_SECONDS, instead of always recording the full cap.
+_SILENCE_RMS = 500.0
+_TRAILING_SILENCE_SECONDS = 1.5
+_MIN_ANSWER_SECONDS = 2.0
+
+QUESTION_TEMPLATES = {
+    "software engineer": [
+        "Tell me about a challenging project you worked on recently.",
+        "How do you approach debugging a production issue?",
+        "Describe a time you disagreed with a teammate about a design.",
+    ],
+    "data scientist": [
+        "Walk me through a model you built end to end.",
+        "How do you decide whether a dataset is good enough to train on?",
+        "Describe a time your analysis changed a business decision.",
+    ],
+    "default": [
+        "Tell me about yourself.",
+        "What interests you about this role?",
+        "Describe a difficult problem you solved at work.",
+    ],
+}
+
+MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+
+@functools.cache
+def get_openai_client():
+    """The shared AsyncOpenAI client, created on the first LLM call.
+
+    Returns ``None`` when ``OPENAI_API_KEY`` is unset, in which case
+    callers fall back to the question templates and TextBlob. No
+    validation request is sent up front; a bad key surfaces on the
+    first real call, which the per-call timeout already bounds.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        logger.warning("OPENAI_API_KEY not set; running in offline mode")
+        return None
+    return AsyncOpenAI(api_key=api_key)
+
+
+_pa = None
+_stream = None
+_stream_lock = threading.Lock()
+
+
+def _close_stream():
+    if _stream is not None:
+        _stream.close()
+        _pa.terminate()
+
+
+def _get_stream():
+    """Open the microphone once and keep the stream for the whole run.
+
+    PortAudio device open/close costs tens to hundreds of ms per
+    question and can cause dropouts; the stream is created stopped and
+    gated with start_stream/stop_stream around each recording.
+    """
+    global _pa, _stream
+    if _stream is None:
+        with _stream_lock:
+            if _stream is None:
+                _pa = pyaudio.PyAudio()
+                _stream = _pa.open(
+                    format=FORMAT,
+                    channels=CHANNELS,
+                    rate=RATE,
+                    input=True,
+                    frames_per_buffer=CHUNK,
+                    start=False,
+                )
+                atexit.register(_close_stream)
+    return _stream
+
+
+def _write_wav(pcm, output_file):
+    with wave.open(output_file, "wb") as wf:
+        wf.setnchannels(CHANNELS)
+        wf.setsampwidth(2)
+        wf.setframerate(RATE)
+        wf.writeframes(pcm.tobytes())
+
+
+def record_audio(output_file=None, max_record_seconds=RECORD_SECONDS):
+    """Record one answer and return it as float32 PCM at 16kHz.
+
+    Samples go straight into a preallocated int16 buffer (no per-chunk
+    list append) and the array is handed to Whisper in memory, skipping
+    the WAV round-trip through disk. Recording stops early after ~1.5s
+    of trailing silence (RMS below _SILENCE_RMS), with
+    ``max_record_seconds`` as the hard cap. Pass ``output_file`` to
+    also keep a WAV copy for logging.
+    """
+    stream = _get_stream()
+    stream.start_stream()
+    buf = np.empty(RATE * max_record_seconds, dtype=np.int16)
+    cursor = 0
+
+    def record():
+        nonlocal cursor
+        silent_samples = 0
+        while cursor < buf.size:
+            data = stream.read(CHUNK, exception_on_overflow=False)
+            chunk = np.frombuffer(data, dtype=np.int16)
+            n = min(chunk.size, buf.size - cursor)
+            buf[cursor:cursor + n] = chunk[:n]
+            cursor += n
+            rms = np.sqrt(np.mean(np.square(chunk.astype(np.float32))))
+            if rms < _SILENCE_RMS:
+                silent_samples += chunk.size
+            else:
+                silent_samples = 0
+            if (
+                cursor > RATE * _MIN_ANSWER_SECONDS
+                and silent_samples > RATE * _TRAILING_SILENCE_SECONDS
+            ):
+                break
+
+    recorder = threading.Thread(target=record)
+    recorder.start()
+    recorder.join()
+    stream.stop_stream()
+
+    pcm = buf[:cursor]
+    if output_file is not None:
+        # The WAV copy is only for logging; write it in the background
+        # so transcription starts immediately after the capture ends.
+        threading.Thread(
+            target=_write_wav, args=(pcm, output_file), daemon=True
+        ).start()
+    return pcm.astype(np.float32) / 32768.0
+
+
+def transcribe_audio(audio):
+    """Transcribe recorded audio with int8 Whisper.
+
+    ``audio`` may be a float32 PCM array at 16kHz (the fast path, no
+    file I/O or resampling) or a path to an audio file. ``vad_filter``
+    skips silent stretches, so pauses in the answer cost nothing to
+    decode.
+    """
+    segments, _ = get_whisper().transcribe(audio, beam_size=1, vad_filter=True)
+    return " ".join(segment.text for segment in segments).strip()
+
+
+def _tts_path(question):
+    return os.path.join(
+        TTS_CACHE_DIR, hashlib.md5(question.encode()).hexdigest() + ".wav"
+    )
+
+
+_tts_lock = threading.Lock()
+_tts_inflight = set()
+
+
+def _synth_to_wav(question, path):
+    """Synthesize one question into the cache, atomically and at most once.
+
+    The WAV is written to a temp file and published with ``os.replace``,
+    so a path existing always means a complete file — speak_question may
+    check the cache while synthesis is still running. Concurrent
+    requests for the same path (prewarm_tts and prefetch_speech can
+    overlap on a template question) are deduped; pyttsx3 engines are
+    not safe to point at one file from two threads.
+    """
+    with _tts_lock:
+        if path in _tts_inflight:
+            return
+        _tts_inflight.add(path)
+    try:
+        tmp_path = path + ".tmp"
+        engine = pyttsx3.init()
+        engine.save_to_file(question, tmp_path)
+        engine.runAndWait()
+        os.replace(tmp_path, path)
+    finally:
+        with _tts_lock:
+            _tts_inflight.discard(path)
+
+
+def prewarm_tts():
+    """Pre-synthesize every template question into the TTS cache.
+
+    The templates are a small fixed set, so after one warm-up run
+    speaking them is a near-free PlaySound of a cached WAV instead of
+    blocking on live synthesis.
+    """
+    os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+    for questions in QUESTION_TEMPLATES.values():
+        for question in questions:
+            path = _tts_path(question)
+            if not os.path.exists(path):
+                _synth_to_wav(question, path)
+
+
+def prefetch_speech(question):
+    """Synthesize a generated question in the background.
+
+    Called as soon as generate_question returns, so synthesis overlaps
+    the scoring of the previous answer.
+    """
+
+    def _synth():
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        path = _tts_path(question)
+        if not os.path.exists(path):
+            _synth_to_wav(question, path)
+
+    threading.Thread(target=_synth, daemon=True).start()
+
+
+def speak_question(question):
+    """Read a question aloud, playing the cached WAV when available."""
+    path = _tts_path(question)
+    if os.path.exists(path):
+        winsound.PlaySound(path, winsound.SND_FILENAME)
+    else:
+        winspeech.say_wait(question)
+
+
+async def generate_question(role, previous_response=None):
+    """Generate the next interview question for the given role."""
+    templates = QUESTION_TEMPLATES.get(role.lower(), QUESTION_TEMPLATES["default"])
+    client = get_openai_client()
+    if client is None:
+        return templates[0]
+    messages = [
+        {"role": "system", "content": "Interview question generator."},
+        {"role": "user", "content": f"Ask one open-ended question for a {role}."},
+    ]
+    if previous_response:
+        messages.append(
+            {"role": "user", "content": f"Their last answer was: {previous_response}"}
+        )
+    completion = await client.chat.completions.create(
+        model=MODEL, messages=messages, max_tokens=60, timeout=10
+    )
+    return completion.choices[0].message.content.strip()
+
+
+async def analyze_response(response_text):
+    """Score one answer, returning ``(score, sentiment)``.
+
+    A single JSON-mode GPT call returns both the score and the
+    sentiment, halving the per-answer LLM latency and dropping the
+    brittle regex parse of a free-text reply. TextBlob is kept only as
+    the offline fallback.
+    """
+    client = get_openai_client()
+    if client is None:
+        return 5, TextBlob(response_text).sentiment.polarity
+    eval_response = await client.chat.completions.create(
+        model=MODEL,
+        response_format={"type": "json_object"},
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    'Score the interview answer as JSON: {"score": 0-10 int, '
+                    '"sentiment": -1..1 float}.'
+                ),
+            },
+            {"role": "user", "content": response_text},
+        ],
+        max_tokens=40,
+        timeout=10,
+    )
+    data = json.loads(eval_response.choices[0].message.content)
+    return int(data.get("score", 5)), float(data.get("sentiment", 0.0))
+
+
+async def generate_feedback(transcript):
+    """Write overall feedback for the interview transcript."""
+    client = get_openai_client()
+    if client is None:
+        return "No feedback available (offline mode)."
+    completion = await client.chat.completions.create(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": "Interview feedback writer."},
+            {"role": "user", "content": transcript},
+        ],
+        max_tokens=180,
+        timeout=10,
+    )
+    return completion.choices[0].message.content.strip()
+
+
+# Shared pool for the blocking stages (audio, Whisper, OpenAI); sized so
+# recording, transcription and LLM calls can overlap.
+_executor = ThreadPoolExecutor(max_workers=4)
+
+
+async def _generate_and_prefetch(role, previous_response):
+    question = await generate_question(role, previous_response)
+    prefetch_speech(question)
+    return question
+
+
+async def _conduct_live_interview(role, num_questions, output_dir):
+    loop = asyncio.get_running_loop()
+    results = []
+    question = await _generate_and_prefetch(role, None)
+
+    for i in range(num_questions):
+        await loop.run_in_executor(_executor, speak_question, question)
+        audio_path = os.path.join(output_dir, f"answer_{i}.wav")
+        audio = await loop.run_in_executor(_executor, record_audio, audio_path)
+        response_text = await loop.run_in_executor(
+            _executor, transcribe_audio, audio
+        )
+
+        # Score this answer and generate the next question concurrently:
+        # two OpenAI round-trips for the price of one.
+        score_task = asyncio.create_task(analyze_response(response_text))
+        if i + 1 < num_questions:
+            next_question_task = asyncio.create_task(
+                _generate_and_prefetch(role, response_text)
+            )
+            (score, sentiment), next_question = await asyncio.gather(
+                score_task, next_question_task
+            )
+        else:
+            score, sentiment = await score_task
+            next_question = None
+
+        logger.info("Q%d score=%d sentiment=%.2f", i + 1, score, sentiment)
+        results.append(
+            {
+                "question": question,
+                "response": response_text,
+                "score": score,
+                "sentiment": sentiment,
+            }
+        )
+        if next_question is not None:
+            question = next_question
+
+    transcript = "\n".join(
+        f"Q: {r['question']}\nA: {r['response']}" for r in results
+    )
+    feedback = await generate_feedback(transcript)
+    return {"results": results, "feedback": feedback}
+
+
+def conduct_live_interview(role, num_questions=5, output_dir="data/interviews"):
+    """Run a spoken interview: ask, record, transcribe and score each answer.
+
+    The stages are pipelined on an event loop so per-question wall time
+    approaches max(record, transcribe + LLM) instead of their sum.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    threading.Thread(target=prewarm_tts, daemon=True).start()
+    return asyncio.run(_conduct_live_interview(role, num_questions, output_dir))
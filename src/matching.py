@@ -0,0 +1,131 @@
+import hashlib
+import logging
+import re
+from functools import lru_cache
+
+import diskcache
+import nltk
+import numpy as np
+from nltk.corpus import wordnet
+
+from src.model_registry import get_sbert
+
+logger = logging.getLogger(__name__)
+
+nltk.download("wordnet", quiet=True)
+
+# Embeddings persisted across runs, keyed by the canonicalized skill
+# set. Stored as float16: half the disk, lossless for cosine ranking.
+_emb_cache = diskcache.Cache("data/cache/sbert")
+
+
+def _skill_key(skills):
+    return hashlib.sha1("\x00".join(sorted(set(skills))).encode()).hexdigest()
+
+
+def _encode_skill_sets(skill_sets):
+    """Embed each expanded skill set, drawing from the disk cache.
+
+    Only cache misses go through SBERT, in one batched call; a fixed
+    job description costs one encode ever, and repeated resumes are
+    free.
+    """
+    keys = [_skill_key(skills) for skills in skill_sets]
+    embeddings = [None] * len(keys)
+    misses = []
+    for i, key in enumerate(keys):
+        cached = _emb_cache.get(key)
+        if cached is not None:
+            embeddings[i] = cached.astype(np.float32)
+        else:
+            misses.append(i)
+    if misses:
+        texts = [" ".join(sorted(skill_sets[i])) for i in misses]
+        encoded = get_sbert().encode(
+            texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+        )
+        for i, embedding in zip(misses, encoded):
+            _emb_cache[keys[i]] = embedding.astype(np.float16)
+            embeddings[i] = embedding
+    return np.vstack(embeddings)
+
+
+@lru_cache(maxsize=8192)
+def _expand_one(keyword):
+    """Synonym and hypernym expansion for a single lowercased keyword.
+
+    WordNet lookups hit a disk-backed corpus, so the per-keyword result
+    is memoized; bulk matching then costs O(unique keywords) lookups
+    instead of O(resumes x keywords).
+    """
+    expanded = {keyword}
+    for synset in wordnet.synsets(keyword):
+        expanded.update(
+            lemma.name().replace("_", " ").lower() for lemma in synset.lemmas()
+        )
+        for hypernym in synset.hypernyms():
+            expanded.update(
+                lemma.name().replace("_", " ").lower() for lemma in hypernym.lemmas()
+            )
+    return frozenset(expanded)
+
+
+def expand_keywords(keywords):
+    """Expand a keyword list with WordNet synonyms and hypernyms."""
+    if not keywords:
+        return set()
+    return set().union(*(_expand_one(keyword.lower()) for keyword in keywords))
+
+
+def _experience_match(resume_data, job_data):
+    min_experience = job_data.get("min_experience", 0)
+    if not min_experience:
+        return 1.0
+    match = re.search(
+        r"(\d+\.?\d*)\s*years?", " ".join(resume_data.get("experience", [])), re.IGNORECASE
+    )
+    years = float(match.group(1)) if match else 0.0
+    return min(years / min_experience, 1.0)
+
+
+def compute_similarities(resume_list, job_data):
+    """Score how well each resume in a batch matches one job description.
+
+    All skill texts (every resume plus the job) go through SBERT in a
+    single batched, normalized encode call, and the cosine similarities
+    fall out of one matmul against the job embedding — one forward pass
+    at batch size N+1 instead of 2N passes at batch size 1. The cheap
+    Jaccard and experience terms are combined per resume afterwards.
+    Returns a list of match scores aligned with ``resume_list``.
+    """
+    job_skills = expand_keywords(job_data.get("required_skills", []))
+    resume_skill_sets = [
+        expand_keywords(resume.get("skills", [])) for resume in resume_list
+    ]
+
+    embeddings = _encode_skill_sets(resume_skill_sets + [job_skills])
+    skill_similarities = embeddings[:-1] @ embeddings[-1]
+
+    scores = []
+    for resume, resume_skills, skill_similarity in zip(
+        resume_list, resume_skill_sets, skill_similarities
+    ):
+        union = resume_skills | job_skills
+        jaccard = len(resume_skills & job_skills) / len(union) if union else 0.0
+        exp_match = _experience_match(resume, job_data)
+        match_score = 0.6 * float(skill_similarity) + 0.3 * jaccard + 0.1 * exp_match
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Similarity score: %.2f (Skills: %.2f, Jaccard: %.2f, Exp: %.2f)",
+                match_score,
+                skill_similarity,
+                jaccard,
+                exp_match,
+            )
+        scores.append(match_score)
+    return scores
+
+
+def compute_similarity(resume_data, job_data):
+    """Score how well one resume matches one job description."""
+    return compute_similarities([resume_data], job_data)[0]
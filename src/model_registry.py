@@ -0,0 +1,157 @@
+"""Lazy, shared accessors for the heavyweight speech and embedding models.
+
+Importing ``src.interview`` or ``src.matching`` used to pay the full
+Whisper / SBERT load (model download check, weight mmap, quantization)
+at import time, even for callers that only wanted the cheap helpers.
+Each model now loads on first use, exactly once per process, behind
+``functools.cache``.
+"""
+
+import functools
+import os
+import shutil
+from collections import namedtuple
+
+# "ctranslate2" (default, via faster-whisper) or "onnx" (ONNX Runtime).
+WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "ctranslate2")
+
+_ONNX_DIR = "data/cache/whisper_onnx_int8"
+
+_Segment = namedtuple("_Segment", "text")
+
+
+def _load_pcm(source):
+    """Decode an audio path or file-like to float32 PCM at 16kHz.
+
+    This repo's own recordings (16kHz mono int16 WAV) are read
+    directly; anything else — uploaded mp3s, 44.1kHz WAVs — goes
+    through faster-whisper's PyAV decoder, which handles arbitrary
+    containers and resamples.
+    """
+    import wave
+
+    import numpy as np
+
+    try:
+        with wave.open(source, "rb") as wf:
+            if (wf.getframerate(), wf.getnchannels(), wf.getsampwidth()) == (
+                16000,
+                1,
+                2,
+            ):
+                frames = wf.readframes(wf.getnframes())
+                return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    except (wave.Error, EOFError):
+        pass
+    if hasattr(source, "seek"):
+        source.seek(0)
+    from faster_whisper.audio import decode_audio
+
+    return decode_audio(source, sampling_rate=16000)
+
+
+class _OnnxWhisper:
+    """Whisper-tiny on ONNX Runtime, dynamically quantized to int8.
+
+    The export is quantized with the AVX-512-VNNI config (per-channel
+    weights), so onnxruntime's int8 matmul kernels can beat CTranslate2
+    on CPUs with VNNI; opt in with ``WHISPER_BACKEND=onnx``. Exposes
+    the slice of faster-whisper's ``transcribe`` surface that
+    :func:`src.interview.transcribe_audio` uses.
+    """
+
+    def __init__(self):
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import WhisperProcessor
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        options.intra_op_num_threads = os.cpu_count()
+        self._model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            self._int8_export(),
+            provider="CPUExecutionProvider",
+            session_options=options,
+            encoder_file_name="encoder_model_quantized.onnx",
+            decoder_file_name="decoder_model_quantized.onnx",
+            decoder_with_past_file_name="decoder_with_past_model_quantized.onnx",
+        )
+        self._processor = WhisperProcessor.from_pretrained("openai/whisper-tiny")
+
+    @staticmethod
+    def _int8_export():
+        """Export whisper-tiny to ONNX and quantize it to dynamic int8.
+
+        Done once and cached under ``data/cache``; the quantized model
+        is built in a temp directory and published with ``os.replace``
+        so a partial export is never loaded.
+        """
+        if not os.path.isdir(_ONNX_DIR):
+            from optimum.onnxruntime import ORTModelForSpeechSeq2Seq, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+            tmp_dir = _ONNX_DIR + ".tmp"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            ORTModelForSpeechSeq2Seq.from_pretrained(
+                "openai/whisper-tiny", export=True
+            ).save_pretrained(tmp_dir)
+            qconfig = AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=True
+            )
+            for file_name in (
+                "encoder_model.onnx",
+                "decoder_model.onnx",
+                "decoder_with_past_model.onnx",
+            ):
+                quantizer = ORTQuantizer.from_pretrained(tmp_dir, file_name=file_name)
+                quantizer.quantize(save_dir=tmp_dir, quantization_config=qconfig)
+            os.replace(tmp_dir, _ONNX_DIR)
+        return _ONNX_DIR
+
+    def transcribe(self, audio, **kwargs):
+        import numpy as np
+
+        if not isinstance(audio, np.ndarray):
+            audio = _load_pcm(audio)
+        inputs = self._processor(audio, sampling_rate=16000, return_tensors="pt")
+        generated = self._model.generate(inputs.input_features)
+        text = self._processor.batch_decode(generated, skip_special_tokens=True)[0]
+        return [_Segment(text.strip())], None
+
+
+@functools.cache
+def get_whisper():
+    """The shared int8 Whisper model, loaded on first transcription.
+
+    By default CTranslate2 runs the tiny Whisper weights with int8
+    dynamic quantization: ~2-4x faster and ~4x smaller than fp32
+    PyTorch on CPU. Set ``WHISPER_BACKEND=onnx`` to run the same
+    weights on ONNX Runtime instead.
+    """
+    if WHISPER_BACKEND == "onnx":
+        return _OnnxWhisper()
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        "tiny", device="cpu", compute_type="int8", cpu_threads=os.cpu_count()
+    )
+
+
+@functools.cache
+def get_sbert():
+    """The shared quantized SBERT encoder, loaded on first encode.
+
+    MiniLM encoding on CPU is bound by fp32 matmul in the Linear layers;
+    dynamic int8 quantization gives ~2-3x encode throughput with
+    negligible drift in cosine similarity.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer("all-MiniLM-L6-v2")
+    model[0].auto_model = torch.quantization.quantize_dynamic(
+        model[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    return model
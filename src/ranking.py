@@ -0,0 +1,248 @@
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+
+import ahocorasick
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# One alternation covers both experience spellings ("5 years" and
+# "2019 - present"), so each entry is scanned once with finditer.
+_EXPERIENCE_RE = re.compile(
+    r"(?P<years>\d+\.?\d*)\s*years?|(?P<start>\d{4})\s*[-\u2013]\s*(?P<end>present|current|\d{4})",
+    re.IGNORECASE,
+)
+_SPLIT_RE = re.compile(r"[,\s;]+")
+
+degree_levels = {
+    "high school": 1,
+    "associate": 2,
+    "diploma": 2,
+    "bachelor": 3,
+    "b.tech": 3,
+    "bsc": 3,
+    "master": 4,
+    "m.tech": 4,
+    "msc": 4,
+    "mba": 4,
+    "phd": 5,
+    "doctorate": 5,
+}
+
+
+# Degree keywords compiled once; finding the best degree mentioned in a
+# string is then a single automaton pass instead of a substring scan
+# per keyword.
+_DEG_AC = ahocorasick.Automaton()
+for _kw, _lvl in degree_levels.items():
+    _DEG_AC.add_word(_kw, (_kw, _lvl))
+_DEG_AC.make_automaton()
+
+
+def _degree_level(text):
+    """Highest degree level mentioned in an already-lowercased string."""
+    return max((lvl for _, (_, lvl) in _DEG_AC.iter(text)), default=0)
+
+
+def _build_skill_automaton(required_skills):
+    """Compile the required skills into an Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for skill in required_skills:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(frozen=True)
+class Normalized:
+    """A resume lower-cased and tokenized once for every scorer.
+
+    Each scorer used to rebuild lower-cased sets and re-split the same
+    combined text, repeating O(resume size) work five times per resume.
+    """
+
+    skills: frozenset
+    experience: tuple
+    education: tuple
+    certifications: frozenset
+    tokens: frozenset
+
+
+def normalize_resume(resume):
+    """Build the :class:`Normalized` view of one resume dict."""
+    skills = resume.get("skills", [])
+    experience = resume.get("experience", [])
+    education = resume.get("education", [])
+    certifications = resume.get("certifications", [])
+    combined = " ".join(skills + experience + education + certifications).lower()
+    return Normalized(
+        skills=frozenset(s.lower() for s in skills),
+        experience=tuple(experience),
+        education=tuple(e.lower() for e in education),
+        certifications=frozenset(c.lower() for c in certifications),
+        tokens=frozenset(t for t in _SPLIT_RE.split(combined) if t),
+    )
+
+
+def compute_skill_similarity(resume_skills, required_skills, automaton=None):
+    """Fraction of required skills covered by the resume.
+
+    Exact matches count fully and partial (substring) matches count
+    half; both sides must already be lower-cased sets. All partial
+    matches are found in a single automaton pass over the resume's
+    concatenated skill text. Pass a prebuilt ``automaton`` when scoring
+    many resumes against the same job.
+    """
+    if not required_skills:
+        return 1.0
+    exact = resume_skills & required_skills
+
+    if automaton is None:
+        automaton = _build_skill_automaton(sorted(required_skills))
+    text = " ".join(sorted(resume_skills))
+    found = {value for _, value in automaton.iter(text)}
+    partial = found - exact
+    return (len(exact) + 0.5 * len(partial)) / len(required_skills)
+
+
+def compute_experience_score(experience, min_experience):
+    """Score total years of experience against the job's minimum."""
+    total_years = 0.0
+    for exp in experience:
+        for match in _EXPERIENCE_RE.finditer(exp):
+            if match.group("years"):
+                total_years += float(match.group("years"))
+            else:
+                end = match.group("end").lower()
+                end_year = (
+                    datetime.now().year if end in ("present", "current") else int(end)
+                )
+                total_years += max(0, end_year - int(match.group("start")))
+    if not min_experience:
+        return 1.0
+    return min(total_years / min_experience, 1.0)
+
+
+def compute_education_similarity(resume_education, required_education):
+    """Compare the resume's best degree level against the job's requirement."""
+    if not required_education:
+        return 1.0
+    # One automaton pass per already-lowercased string, then integers.
+    r_level = max((_degree_level(r_edu) for r_edu in resume_education), default=0)
+    j_level = max((_degree_level(j_edu) for j_edu in required_education), default=0)
+    if j_level == 0 or r_level >= j_level:
+        return 1.0
+    return r_level / j_level
+
+
+def compute_certification_score(resume_certifications, required_certifications):
+    """Fraction of required certifications the resume mentions.
+
+    Both sides must already be lower-cased sets.
+    """
+    if not required_certifications:
+        return 1.0
+    matched = sum(
+        1
+        for req in required_certifications
+        if any(req in cert for cert in resume_certifications)
+    )
+    return matched / len(required_certifications)
+
+
+def compute_ats_score(resume_tokens, keywords):
+    """Keyword-density bonus in the style of an ATS scan (0-10).
+
+    ``resume_tokens`` is the pre-split lower-cased token set from
+    :func:`normalize_resume`; ``keywords`` the lower-cased required
+    skills.
+    """
+    if not keywords:
+        return 0.0
+    return 10.0 * len(resume_tokens & keywords) / len(keywords)
+
+
+def rank_candidates(resume_data_list, job_data):
+    """Score and rank all resumes against one job description.
+
+    Per-resume features are extracted in a single pass, the weighted
+    total is one vectorized expression over the feature frame, and the
+    ordering comes from a stable argsort instead of a Python-level sort
+    of candidate dicts.
+    """
+    if not resume_data_list:
+        return []
+    # Normalize the job once, outside the resume loop.
+    required_skills = frozenset(
+        s.lower() for s in job_data.get("required_skills", [])
+    )
+    automaton = (
+        _build_skill_automaton(sorted(required_skills)) if required_skills else None
+    )
+    min_experience = job_data.get("min_experience", 0)
+    required_education = tuple(e.lower() for e in job_data.get("education", []))
+    required_certifications = frozenset(
+        c.lower() for c in job_data.get("certifications", [])
+    )
+
+    df = pd.DataFrame(
+        [
+            {
+                "skill_score": round(
+                    compute_skill_similarity(
+                        norm.skills, required_skills, automaton
+                    ),
+                    3,
+                ),
+                "experience_score": round(
+                    compute_experience_score(norm.experience, min_experience), 3
+                ),
+                "education_score": round(
+                    compute_education_similarity(
+                        norm.education, required_education
+                    ),
+                    3,
+                ),
+                "certification_score": round(
+                    compute_certification_score(
+                        norm.certifications, required_certifications
+                    ),
+                    3,
+                ),
+                "ats_score": round(
+                    compute_ats_score(norm.tokens, required_skills), 2
+                ),
+            }
+            for norm in map(normalize_resume, resume_data_list)
+        ]
+    )
+    df["total_score"] = (
+        50 * df["skill_score"]
+        + 30 * df["experience_score"]
+        + 15 * df["education_score"]
+        + 5 * df["certification_score"]
+        + df["ats_score"]
+    ).round(2)
+
+    order = np.argsort(-df["total_score"].to_numpy(), kind="stable")
+    records = df.to_dict("records")
+    results = []
+    for rank, idx in enumerate(order, start=1):
+        resume = resume_data_list[idx]
+        record = records[idx]
+        logger.debug(
+            "Candidate %s: total=%.1f (skills=%.2f, exp=%.2f, edu=%.2f, "
+            "certs=%.2f, ats=%.1f)",
+            resume.get("name", "Unknown"),
+            record["total_score"],
+            record["skill_score"],
+            record["experience_score"],
+            record["education_score"],
+            record["certification_score"],
+            record["ats_score"],
+        )
+        results.append({"resume": resume, **record, "rank": rank})
+    return results
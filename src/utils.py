@@ -0,0 +1,16 @@
+"""Shared helpers for the HR Agent modules."""
+
+import logging
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def setup_logging(level=logging.INFO):
+    """Configure root logging once for the whole process.
+
+    Every module used to call ``logging.basicConfig`` at import time,
+    making handler setup an import side effect that depended on which
+    module got imported first. Entry points call this once; library
+    modules only create ``logging.getLogger(__name__)``.
+    """
+    logging.basicConfig(level=level, format=_LOG_FORMAT)